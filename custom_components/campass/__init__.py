@@ -1,13 +1,17 @@
 """The CamPass integration."""
+import asyncio
 import logging
 import secrets
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.event import async_track_state_change_event
 
 from .const import DOMAIN
 from .views import (
+    FRONTEND_DIR,
     CamPassAuthView,
     CamPassEventsView,
     CamPassPinView,
@@ -18,8 +22,16 @@ from .views import (
     CamPassViewerView,
 )
 
+try:
+    from homeassistant.components.http import StaticPathConfig
+except ImportError:  # Home Assistant < 2024.7
+    StaticPathConfig = None
+
 _LOGGER = logging.getLogger(__name__)
 
+# Slugs can't contain "_", so this never collides with a share URL
+STATIC_URL = "/campass/_static"
+
 PLATFORMS = ["switch"]
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
@@ -33,35 +45,178 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up CamPass from a config entry."""
+    entry_data = hass.data[DOMAIN].setdefault(entry.entry_id, {})
+    if entry_data.get("loaded"):
+        # Already set up (e.g. a retry raced a reload) - don't forward platforms twice
+        return True
+
     # Generate JWT secret for this instance if not already present
-    hass.data[DOMAIN].setdefault(entry.entry_id, {})
-    if "jwt_secret" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["jwt_secret"] = secrets.token_urlsafe(32)
-    
+    if "jwt_secret" not in entry_data:
+        entry_data["jwt_secret"] = secrets.token_urlsafe(32)
+    entry_data["jwt_secret_bytes"] = entry_data["jwt_secret"].encode("utf-8")
+
+    _async_refresh_entry_data(hass, entry)
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Register HTTP views (only once, they handle all slugs)
-    if "_views_registered" not in hass.data[DOMAIN]:
-        hass.http.register_view(CamPassRedirectView())
-        hass.http.register_view(CamPassPinView())
-        hass.http.register_view(CamPassViewerView())
-        hass.http.register_view(CamPassAuthView())
-        hass.http.register_view(CamPassStatusView())
-        hass.http.register_view(CamPassEventsView())
-        hass.http.register_view(CamPassStreamInfoView())
-        hass.http.register_view(CamPassStreamView())
-        hass.data[DOMAIN]["_views_registered"] = True
-        _LOGGER.info("CamPass HTTP views registered")
-    
+    async with hass.data[DOMAIN].setdefault("_views_lock", asyncio.Lock()):
+        if "_views_registered" not in hass.data[DOMAIN]:
+            hass.http.register_view(CamPassRedirectView())
+            hass.http.register_view(CamPassPinView())
+            hass.http.register_view(CamPassViewerView())
+            hass.http.register_view(CamPassAuthView())
+            hass.http.register_view(CamPassStatusView())
+            hass.http.register_view(CamPassEventsView())
+            hass.http.register_view(CamPassStreamInfoView())
+            hass.http.register_view(CamPassStreamView())
+            # CSS/JS are served straight from disk by aiohttp's file sender
+            static_dir = str(FRONTEND_DIR / "static")
+            if StaticPathConfig is not None:
+                await hass.http.async_register_static_paths(
+                    [StaticPathConfig(STATIC_URL, static_dir, False)]
+                )
+            else:
+                hass.http.register_static_path(STATIC_URL, static_dir, False)
+            hass.data[DOMAIN]["_views_registered"] = True
+            _LOGGER.info("CamPass HTTP views registered")
+
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
-    
+    entry_data["loaded"] = True
+
     return True
 
 
+@callback
+def _async_refresh_entry_data(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Precompute per-request values derived from the entry's data."""
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+
+    # Keep the slug -> entry index used by the HTTP views current
+    by_slug = hass.data[DOMAIN].setdefault("_by_slug", {})
+    old_slug = entry_data.get("slug")
+    if old_slug is not None and by_slug.get(old_slug) is entry:
+        del by_slug[old_slug]
+    slug = entry_data["slug"] = entry.data["slug"]
+    by_slug[slug] = entry
+
+    entry_data["switch_entity_id"] = f"switch.campass_{slug}"
+    entry_data["cookie_name"] = f"campass_{slug}"
+    _async_track_sharing_state(hass, entry_data)
+
+    entry_data["cameras_set"] = frozenset(entry.data.get("cameras", []))
+    entry_data["camera_entities"] = {}
+    _async_track_camera_names(hass, entry, entry_data)
+    entry_data["passcode_bytes"] = str(
+        entry.data.get("passcode") or entry.data.get("pin") or ""
+    ).encode("utf-8")
+
+
+@callback
+def _async_track_sharing_state(hass: HomeAssistant, entry_data: dict) -> None:
+    """Fan switch state changes out to every SSE client of a share with one listener."""
+    hub = entry_data.setdefault(
+        "sse_hub", {"available": False, "closed": False, "subs": set(), "unsub": None}
+    )
+    switch_id = entry_data["switch_entity_id"]
+    if hub.get("entity_id") == switch_id:
+        return
+    if hub["unsub"] is not None:
+        hub["unsub"]()
+
+    @callback
+    def _async_switch_changed(event: Event) -> None:
+        new_state = event.data.get("new_state")
+        if new_state:
+            hub["available"] = new_state.state == "on"
+            for change_event in hub["subs"]:
+                change_event.set()
+
+    state = hass.states.get(switch_id)
+    hub["available"] = state is not None and state.state == "on"
+    hub["entity_id"] = switch_id
+    hub["unsub"] = async_track_state_change_event(hass, [switch_id], _async_switch_changed)
+
+
+@callback
+def _async_track_camera_names(hass: HomeAssistant, entry: ConfigEntry, entry_data: dict) -> None:
+    """Keep the /status camera list cached, rebuilding it when a camera appears, goes away or is renamed.
+
+    The same listener drops cached camera entity objects when a camera is added, removed
+    or becomes unavailable, which is what an integration reload looks like.
+    """
+    if entry_data.get("cameras_unsub") is not None:
+        entry_data["cameras_unsub"]()
+    camera_ids = list(entry.data.get("cameras", []))
+
+    @callback
+    def _async_rebuild() -> None:
+        cameras = []
+        for camera_id in camera_ids:
+            state = hass.states.get(camera_id)
+            if state:
+                cameras.append({
+                    "entity_id": camera_id,
+                    "name": state.attributes.get("friendly_name", camera_id),
+                })
+        entry_data["cameras_payload"] = cameras
+
+    @callback
+    def _async_camera_changed(event: Event) -> None:
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if (
+            old_state is None
+            or new_state is None
+            or old_state.state == STATE_UNAVAILABLE
+            or new_state.state == STATE_UNAVAILABLE
+        ):
+            # Added, removed or reloaded (registry entities go through a restored
+            # "unavailable" state): any cached entity object may be dead
+            entry_data.setdefault("camera_entities", {}).pop(event.data["entity_id"], None)
+        # Cameras update state often (e.g. access token rotation); only names matter here
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.attributes.get("friendly_name") == new_state.attributes.get("friendly_name")
+        ):
+            return
+        _async_rebuild()
+
+    _async_rebuild()
+    entry_data["cameras_unsub"] = async_track_state_change_event(
+        hass, camera_ids, _async_camera_changed
+    )
+
+
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Refresh derived values when the options flow updates the entry."""
+    if entry.entry_id in hass.data[DOMAIN]:
+        _async_refresh_entry_data(hass, entry)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id, None)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id, None)
+        if entry_data is not None:
+            entry_data["loaded"] = False
+            hub = entry_data.get("sse_hub")
+            if hub is not None:
+                if hub["unsub"] is not None:
+                    hub["unsub"]()
+                    hub["unsub"] = None
+                # Wake open /events clients so they disconnect and reconnect to the new hub
+                hub["closed"] = True
+                for change_event in hub["subs"]:
+                    change_event.set()
+            if entry_data.get("cameras_unsub") is not None:
+                entry_data["cameras_unsub"]()
+                entry_data["cameras_unsub"] = None
+            by_slug = hass.data[DOMAIN].get("_by_slug", {})
+            if by_slug.get(entry_data.get("slug")) is entry:
+                del by_slug[entry_data["slug"]]
     
     return unload_ok
@@ -1,6 +1,7 @@
 """Config flow for CamPass integration."""
 import re
 import logging
+import string
 from typing import Any
 
 import voluptuous as vol
@@ -19,22 +20,87 @@ AUTH_TYPES = {
     AUTH_TYPE_ALPHANUMERIC: "Alphanumeric password",
 }
 
+_RE_SLUG = re.compile(r'[a-z0-9\-]+')
+_RE_PIN4 = re.compile(r'\d{4}')
+_RE_PIN6 = re.compile(r'\d{6}')
+
+
+class _SlugTable(dict):
+    """str.translate table: keep [a-z0-9-], map whitespace/underscore to '-', drop the rest."""
+
+    def __missing__(self, key: int) -> str | None:
+        char = chr(key)
+        value = "-" if char == "_" or char.isspace() else None
+        self[key] = value
+        return value
+
+
+_SLUG_TABLE = _SlugTable({ord(c): c for c in string.ascii_lowercase + string.digits + "-"})
+
+_AUTH_TYPE_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=k, label=v)
+            for k, v in AUTH_TYPES.items()
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+_SESSION_DURATION_SELECTOR = selector.SelectSelector(
+    selector.SelectSelectorConfig(
+        options=[
+            selector.SelectOptionDict(value=k, label=v[0])
+            for k, v in SESSION_DURATIONS.items()
+        ],
+        mode=selector.SelectSelectorMode.DROPDOWN,
+    )
+)
+
+_CAMERAS_SELECTOR = selector.EntitySelector(
+    selector.EntitySelectorConfig(
+        domain="camera",
+        multiple=True,
+    )
+)
+
+_USER_SCHEMA = vol.Schema({
+    vol.Required("name"): str,
+    vol.Required("auth_type", default=AUTH_TYPE_PIN4): _AUTH_TYPE_SELECTOR,
+    vol.Required("passcode"): str,
+    vol.Optional("slug"): str,
+    vol.Optional(CONF_SESSION_DURATION, default="24h"): _SESSION_DURATION_SELECTOR,
+    vol.Optional(CONF_ENABLE_NOTIFICATIONS, default=False): selector.BooleanSelector(),
+})
+
+_CAMERAS_SCHEMA = vol.Schema({
+    vol.Required("cameras"): _CAMERAS_SELECTOR,
+})
+
+# Current values are filled in per entry via add_suggested_values_to_schema
+_OPTIONS_SCHEMA = vol.Schema({
+    vol.Required("name"): str,
+    vol.Required("auth_type"): _AUTH_TYPE_SELECTOR,
+    vol.Required("passcode"): str,
+    vol.Required("slug"): str,
+    vol.Required("cameras"): _CAMERAS_SELECTOR,
+    vol.Optional(CONF_SESSION_DURATION, default="24h"): _SESSION_DURATION_SELECTOR,
+    vol.Optional(CONF_ENABLE_NOTIFICATIONS, default=False): selector.BooleanSelector(),
+})
+
 
 def slugify(text: str) -> str:
     """Convert text to a URL-safe slug."""
-    text = text.lower()
-    text = re.sub(r'[\s_]+', '-', text)
-    text = re.sub(r'[^a-z0-9\-]', '', text)
-    text = re.sub(r'-+', '-', text)
-    text = text.strip('-')
-    return text
+    text = text.lower().translate(_SLUG_TABLE)
+    # Collapse dash runs and strip leading/trailing dashes in one pass
+    return "-".join(part for part in text.split("-") if part)
 
 
 def validate_slug(slug: str) -> bool:
     """Validate slug format."""
     if not slug or len(slug) > 32:
         return False
-    return bool(re.match(r'^[a-z0-9\-]+$', slug))
+    return bool(_RE_SLUG.fullmatch(slug))
 
 
 def validate_passcode(passcode: str, auth_type: str) -> bool:
@@ -42,9 +108,9 @@ def validate_passcode(passcode: str, auth_type: str) -> bool:
     if not passcode:
         return False
     if auth_type == AUTH_TYPE_PIN4:
-        return bool(re.match(r'^\d{4}$', passcode))
+        return bool(_RE_PIN4.fullmatch(passcode))
     if auth_type == AUTH_TYPE_PIN6:
-        return bool(re.match(r'^\d{6}$', passcode))
+        return bool(_RE_PIN6.fullmatch(passcode))
     if auth_type == AUTH_TYPE_ALPHANUMERIC:
         return len(passcode) >= 4
     return False
@@ -58,6 +124,16 @@ class CamPassConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     def __init__(self):
         """Initialize the config flow."""
         self._data = {}
+        self._existing_slugs: frozenset[str] | None = None
+
+    @callback
+    def _async_existing_slugs(self) -> frozenset[str]:
+        """Return the slugs already used by other CamPass entries."""
+        if self._existing_slugs is None:
+            self._existing_slugs = frozenset(
+                entry.data.get("slug") for entry in self._async_current_entries()
+            )
+        return self._existing_slugs
 
     async def async_step_user(self, user_input: dict[str, Any] | None = None):
         """Handle the initial step - name, auth type, passcode."""
@@ -87,10 +163,8 @@ class CamPassConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
             # Check slug uniqueness
             if not errors:
-                for entry in self._async_current_entries():
-                    if entry.data.get("slug") == slug:
-                        errors["slug"] = "slug_taken"
-                        break
+                if slug in self._async_existing_slugs():
+                    errors["slug"] = "slug_taken"
 
             if not errors:
                 self._data = {
@@ -105,30 +179,7 @@ class CamPassConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="user",
-            data_schema=vol.Schema({
-                vol.Required("name"): str,
-                vol.Required("auth_type", default=AUTH_TYPE_PIN4): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=k, label=v)
-                            for k, v in AUTH_TYPES.items()
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required("passcode"): str,
-                vol.Optional("slug"): str,
-                vol.Optional(CONF_SESSION_DURATION, default="24h"): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=k, label=v[0])
-                            for k, v in SESSION_DURATIONS.items()
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(CONF_ENABLE_NOTIFICATIONS, default=False): selector.BooleanSelector(),
-            }),
+            data_schema=_USER_SCHEMA,
             errors=errors,
         )
 
@@ -148,24 +199,12 @@ class CamPassConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     data=self._data,
                 )
 
-        camera_entities = [
-            entity_id
-            for entity_id in self.hass.states.async_entity_ids("camera")
-        ]
-
-        if not camera_entities:
+        if not self.hass.states.async_entity_ids_count("camera"):
             return self.async_abort(reason="no_cameras")
 
         return self.async_show_form(
             step_id="cameras",
-            data_schema=vol.Schema({
-                vol.Required("cameras"): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="camera",
-                        multiple=True,
-                    )
-                ),
-            }),
+            data_schema=_CAMERAS_SCHEMA,
             errors=errors,
             description_placeholders={"name": self._data["name"]},
         )
@@ -180,6 +219,19 @@ class CamPassConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 class CamPassOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for CamPass."""
 
+    _existing_slugs: frozenset[str] | None = None
+
+    @callback
+    def _async_existing_slugs(self) -> frozenset[str]:
+        """Return the slugs used by CamPass entries other than this one."""
+        if self._existing_slugs is None:
+            self._existing_slugs = frozenset(
+                entry.data.get("slug")
+                for entry in self.hass.config_entries.async_entries(DOMAIN)
+                if entry.entry_id != self.config_entry.entry_id
+            )
+        return self._existing_slugs
+
     async def async_step_init(self, user_input: dict[str, Any] | None = None):
         """Manage the options."""
         errors = {}
@@ -201,11 +253,8 @@ class CamPassOptionsFlow(config_entries.OptionsFlow):
                 errors["slug"] = "invalid_slug"
 
             if not errors:
-                for entry in self.hass.config_entries.async_entries(DOMAIN):
-                    if entry.entry_id != self.config_entry.entry_id:
-                        if entry.data.get("slug") == slug:
-                            errors["slug"] = "slug_taken"
-                            break
+                if slug in self._async_existing_slugs():
+                    errors["slug"] = "slug_taken"
 
             cameras = user_input.get("cameras", [])
             if not cameras:
@@ -226,58 +275,17 @@ class CamPassOptionsFlow(config_entries.OptionsFlow):
                 )
                 return self.async_create_entry(title="", data={})
 
+        data = self.config_entry.data
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema({
-                vol.Required(
-                    "name",
-                    default=self.config_entry.data.get("name"),
-                ): str,
-                vol.Required(
-                    "auth_type",
-                    default=self.config_entry.data.get("auth_type", AUTH_TYPE_PIN4),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=k, label=v)
-                            for k, v in AUTH_TYPES.items()
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Required(
-                    "passcode",
-                    default=self.config_entry.data.get("passcode", self.config_entry.data.get("pin", "")),
-                ): str,
-                vol.Required(
-                    "slug",
-                    default=self.config_entry.data.get("slug"),
-                ): str,
-                vol.Required(
-                    "cameras",
-                    default=self.config_entry.data.get("cameras", []),
-                ): selector.EntitySelector(
-                    selector.EntitySelectorConfig(
-                        domain="camera",
-                        multiple=True,
-                    )
-                ),
-                vol.Optional(
-                    CONF_SESSION_DURATION,
-                    default=self.config_entry.data.get(CONF_SESSION_DURATION, "24h"),
-                ): selector.SelectSelector(
-                    selector.SelectSelectorConfig(
-                        options=[
-                            selector.SelectOptionDict(value=k, label=v[0])
-                            for k, v in SESSION_DURATIONS.items()
-                        ],
-                        mode=selector.SelectSelectorMode.DROPDOWN,
-                    )
-                ),
-                vol.Optional(
-                    CONF_ENABLE_NOTIFICATIONS,
-                    default=self.config_entry.data.get(CONF_ENABLE_NOTIFICATIONS, False),
-                ): selector.BooleanSelector(),
+            data_schema=self.add_suggested_values_to_schema(_OPTIONS_SCHEMA, {
+                "name": data.get("name"),
+                "auth_type": data.get("auth_type", AUTH_TYPE_PIN4),
+                "passcode": data.get("passcode", data.get("pin", "")),
+                "slug": data.get("slug"),
+                "cameras": data.get("cameras", []),
+                CONF_SESSION_DURATION: data.get(CONF_SESSION_DURATION, "24h"),
+                CONF_ENABLE_NOTIFICATIONS: data.get(CONF_ENABLE_NOTIFICATIONS, False),
             }),
             errors=errors,
         )
@@ -0,0 +1,120 @@
+const PIN_LENGTH = AUTH_TYPE === 'pin6' ? 6 : 4;
+
+let pin = '';
+let isSubmitting = false;
+
+const pinDisplay = document.getElementById('pinDisplay');
+const keypad = document.getElementById('keypad');
+const textWrapper = document.getElementById('textWrapper');
+const submitBtn = document.getElementById('submitBtn');
+const textInput = document.getElementById('textInput');
+const errorEl = document.getElementById('error');
+const subtitle = document.getElementById('subtitle');
+
+// Configure UI based on auth type
+if (AUTH_TYPE === 'alphanumeric') {
+    pinDisplay.style.display = 'none';
+    keypad.style.display = 'none';
+    textWrapper.style.display = 'block';
+    submitBtn.style.display = 'block';
+    subtitle.textContent = 'Enter password';
+    textInput.focus();
+
+    textInput.addEventListener('keydown', (e) => {
+        if (e.key === 'Enter') submitAlphanumeric();
+    });
+} else {
+    subtitle.textContent = `Enter ${PIN_LENGTH}-digit passcode`;
+    updatePinDisplay();
+}
+
+function updatePinDisplay() {
+    pinDisplay.innerHTML = Array(PIN_LENGTH)
+        .fill(0)
+        .map((_, i) => `<div class="pin-dot ${i < pin.length ? 'filled' : ''}"></div>`)
+        .join('');
+}
+
+function showError(msg) {
+    errorEl.textContent = msg;
+    errorEl.classList.add('show');
+    pinDisplay.classList.add('shake');
+    textWrapper.classList.add('shake');
+    setTimeout(() => {
+        errorEl.classList.remove('show');
+        pinDisplay.classList.remove('shake');
+        textWrapper.classList.remove('shake');
+    }, 2000);
+}
+
+async function submitPasscode(passcode) {
+    if (isSubmitting) return;
+    isSubmitting = true;
+    errorEl.innerHTML = '<span class="loading"></span>';
+    errorEl.classList.add('show');
+
+    try {
+        const res = await fetch(`/campass/${SLUG}/api/auth`, {
+            method: 'POST',
+            headers: {'Content-Type': 'application/json'},
+            body: JSON.stringify({pin: passcode}),
+        });
+
+        if (res.ok) {
+            window.location.href = `/campass/${SLUG}/viewer`;
+        } else {
+            pin = '';
+            updatePinDisplay();
+            textInput.value = '';
+            const data = await res.json().catch(() => ({}));
+            if (res.status === 429) {
+                showError('Too many attempts, please try again later');
+            } else if (data.error === 'Sharing is disabled') {
+                showError('Camera is not available right now');
+            } else {
+                showError('Incorrect passcode');
+            }
+        }
+    } catch {
+        showError('Connection error');
+    } finally {
+        isSubmitting = false;
+    }
+}
+
+function submitAlphanumeric() {
+    const val = textInput.value.trim();
+    if (val) submitPasscode(val);
+}
+
+function handleKey(key) {
+    if (isSubmitting) return;
+    if (key === 'del') {
+        pin = pin.slice(0, -1);
+    } else if (pin.length < PIN_LENGTH) {
+        pin += key;
+    }
+    updatePinDisplay();
+    if (pin.length === PIN_LENGTH) {
+        setTimeout(() => submitPasscode(pin), 200);
+    }
+}
+
+document.querySelectorAll('.key').forEach(key => {
+    key.addEventListener('click', () => {
+        const v = key.dataset.key;
+        if (v) handleKey(v);
+    });
+});
+
+// Keyboard support for PIN modes
+if (AUTH_TYPE !== 'alphanumeric') {
+    document.addEventListener('keydown', (e) => {
+        if (e.key >= '0' && e.key <= '9') {
+            handleKey(e.key);
+        } else if (e.key === 'Backspace') {
+            e.preventDefault();
+            handleKey('del');
+        }
+    });
+}
@@ -0,0 +1,224 @@
+let cameras = [];
+let currentCamera = null;
+let currentHls = null;
+let eventSource = null;
+let isAvailable = false;
+
+const viewerContainer = document.getElementById('viewerContainer');
+const cameraSelector = document.getElementById('cameraSelector');
+
+function redirectToLogin() {
+    window.location.href = `/campass/${slug}/`;
+}
+
+async function authFetch(url) {
+    const res = await fetch(url);
+    if (res.status === 401) { redirectToLogin(); return null; }
+    return res;
+}
+
+async function checkStatus() {
+    try {
+        const res = await authFetch(`/campass/${slug}/api/status`);
+        if (!res) return;
+        const data = await res.json();
+
+        if (!data.available) {
+            isAvailable = false;
+            destroyStream();
+            showMessage('Camera Not Available', 'Sharing has been disabled by the owner.', false);
+            return;
+        }
+
+        isAvailable = true;
+        cameras = data.cameras;
+        if (!cameras.length) {
+            showMessage('No Cameras', 'No cameras are currently available.', false);
+            return;
+        }
+
+        if (!currentCamera) {
+            currentCamera = cameras[0].entity_id;
+            setupCameraTabs();
+            loadStream(currentCamera);
+        }
+    } catch {
+        showMessage('Connection Error', 'Unable to connect to camera feed.', true);
+    }
+}
+
+function connectEvents() {
+    if (eventSource) eventSource.close();
+    eventSource = new EventSource(`/campass/${slug}/api/events`);
+    eventSource.onmessage = (e) => {
+        try {
+            const data = JSON.parse(e.data);
+            if (data.available && !isAvailable) {
+                // Sharing just turned on — reload
+                isAvailable = true;
+                currentCamera = null;
+                checkStatus();
+            } else if (!data.available && isAvailable) {
+                // Sharing just turned off — kill stream immediately
+                isAvailable = false;
+                destroyStream();
+                showMessage('Camera Not Available', 'Sharing has been disabled by the owner.', false);
+            }
+        } catch {}
+    };
+    eventSource.onerror = () => {
+        eventSource.close();
+        // Check if we're still authed before reconnecting
+        fetch(`/campass/${slug}/api/status`).then(res => {
+            if (res.status === 401) {
+                redirectToLogin();
+            } else {
+                setTimeout(connectEvents, 5000);
+            }
+        }).catch(() => setTimeout(connectEvents, 5000));
+    };
+}
+
+function setupCameraTabs() {
+    if (cameras.length <= 1) {
+        cameraSelector.classList.add('hidden');
+        return;
+    }
+    cameraSelector.classList.remove('hidden');
+    cameraSelector.innerHTML = '';
+    cameras.forEach(cam => {
+        const tab = document.createElement('button');
+        tab.className = `camera-tab${cam.entity_id === currentCamera ? ' active' : ''}`;
+        tab.textContent = cam.name;
+        tab.addEventListener('click', () => {
+            if (cam.entity_id === currentCamera) return;
+            currentCamera = cam.entity_id;
+            cameraSelector.querySelectorAll('.camera-tab').forEach(t => t.classList.remove('active'));
+            tab.classList.add('active');
+            loadStream(currentCamera);
+        });
+        cameraSelector.appendChild(tab);
+    });
+}
+
+async function loadStream(cameraId) {
+    destroyStream();
+    viewerContainer.innerHTML = '<div class="loading"><div class="spinner"></div><div>Loading stream...</div></div>';
+
+    try {
+        // Ask the backend what stream type is available
+        const res = await authFetch(`/campass/${slug}/api/stream-info/${cameraId}`);
+        if (!res) return;
+        if (!res.ok) throw new Error('Stream info request failed');
+        const info = await res.json();
+
+        if (info.type === 'hls' && info.url) {
+            loadHlsStream(info.url);
+        } else {
+            loadMjpegStream(cameraId);
+        }
+    } catch (err) {
+        // Fallback to MJPEG directly
+        loadMjpegStream(cameraId);
+    }
+}
+
+function loadHlsStream(url) {
+    viewerContainer.innerHTML = `
+        <div class="loading" id="streamLoading">
+            <div class="spinner"></div>
+            <div>Connecting to camera...</div>
+        </div>
+        <video class="stream" id="hlsVideo" autoplay muted playsinline style="display:none"></video>
+    `;
+    const video = document.getElementById('hlsVideo');
+    const loading = document.getElementById('streamLoading');
+
+    function onPlaying() {
+        loading.style.display = 'none';
+        video.style.display = 'block';
+    }
+    video.addEventListener('playing', onPlaying);
+
+    // Timeout fallback — if nothing plays in 10s, try MJPEG
+    const timeout = setTimeout(() => {
+        if (video.paused || video.readyState < 2) {
+            destroyStream();
+            loadMjpegStream(currentCamera);
+        }
+    }, 10000);
+    video.addEventListener('playing', () => clearTimeout(timeout));
+
+    if (video.canPlayType('application/vnd.apple.mpegurl')) {
+        video.src = url;
+        video.addEventListener('error', () => {
+            clearTimeout(timeout);
+            loadMjpegStream(currentCamera);
+        });
+    } else if (Hls.isSupported()) {
+        currentHls = new Hls({
+            enableWorker: true,
+            lowLatencyMode: true,
+            backBufferLength: 0,
+        });
+        currentHls.loadSource(url);
+        currentHls.attachMedia(video);
+        currentHls.on(Hls.Events.ERROR, (event, data) => {
+            if (data.fatal) {
+                clearTimeout(timeout);
+                destroyStream();
+                loadMjpegStream(currentCamera);
+            }
+        });
+    } else {
+        clearTimeout(timeout);
+        loadMjpegStream(currentCamera);
+    }
+}
+
+function loadMjpegStream(cameraId) {
+    viewerContainer.innerHTML = `
+        <div class="loading" id="mjpegLoading">
+            <div class="spinner"></div>
+            <div>Connecting to camera...</div>
+        </div>
+        <img class="stream" id="mjpegImg" style="display:none"
+             src="/campass/${slug}/api/stream/${cameraId}"
+             alt="Camera Stream">
+    `;
+    const img = document.getElementById('mjpegImg');
+    const loading = document.getElementById('mjpegLoading');
+    img.onload = () => {
+        loading.style.display = 'none';
+        img.style.display = 'block';
+    };
+    img.onerror = () => {
+        showMessage('Stream Error', 'Unable to load camera stream.', true);
+    };
+}
+
+function destroyStream() {
+    if (currentHls) {
+        currentHls.destroy();
+        currentHls = null;
+    }
+}
+
+function showMessage(title, text, showRetry) {
+    destroyStream();
+    viewerContainer.innerHTML = `
+        <div class="message">
+            <div class="message-title">${title}</div>
+            <div class="message-text">${text}</div>
+            ${showRetry ? '<button class="retry-button" onclick="retry()">Retry</button>' : ''}
+        </div>
+    `;
+}
+
+function retry() {
+    currentCamera = null;
+    checkStatus();
+}
+
+checkStatus();
+connectEvents();
@@ -1,7 +1,8 @@
 """Logbook support for CamPass."""
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from typing import Any
 
 from homeassistant.components.logbook import LOGBOOK_ENTRY_MESSAGE, LOGBOOK_ENTRY_NAME
 from homeassistant.core import Event, HomeAssistant, callback
@@ -10,10 +11,22 @@ from .const import DOMAIN
 
 EVENT_CAMPASS_ACCESS = "campass_access"
 
-MESSAGES = {
-    "auth_success": "authenticated to '{share}' share from {ip}",
-    "auth_failure": "failed authentication to '{share}' share from {ip}",
-    "camera_view": "viewed camera {camera_id} on '{share}' share from {ip}",
+
+def _describe_default(data: Mapping[str, Any]) -> str:
+    """Describe an event type without a dedicated message."""
+    return f"performed '{data.get('type', 'unknown')}' on share '{data.get('share', 'unknown')}'"
+
+
+_DESCRIBERS: dict[str, Callable[[Mapping[str, Any]], str]] = {
+    "auth_success": lambda d: (
+        f"authenticated to '{d.get('share', 'unknown')}' share from {d.get('ip', 'unknown')}"
+    ),
+    "auth_failure": lambda d: (
+        f"failed authentication to '{d.get('share', 'unknown')}' share from {d.get('ip', 'unknown')}"
+    ),
+    "camera_view": lambda d: (
+        f"viewed camera {d.get('camera_id', '')} on '{d.get('share', 'unknown')}' share from {d.get('ip', 'unknown')}"
+    ),
 }
 
 
@@ -28,22 +41,11 @@ def async_describe_events(
     def async_describe_campass_event(event: Event):
         """Describe a CamPass access event."""
         data = event.data
-        event_type = data.get("type", "unknown")
-        share = data.get("share", "unknown")
-        ip = data.get("ip", "unknown")
-        camera_id = data.get("camera_id", "")
-
-        template = MESSAGES.get(event_type, "performed '{type}' on share '{share}'")
-        message = template.format(
-            share=share,
-            ip=ip,
-            camera_id=camera_id,
-            type=event_type,
-        )
+        describe = _DESCRIBERS.get(data.get("type"), _describe_default)
 
         return {
             LOGBOOK_ENTRY_NAME: "CamPass",
-            LOGBOOK_ENTRY_MESSAGE: message,
+            LOGBOOK_ENTRY_MESSAGE: describe(data),
         }
 
     async_describe_event(DOMAIN, EVENT_CAMPASS_ACCESS, async_describe_campass_event)
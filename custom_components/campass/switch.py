@@ -1,5 +1,7 @@
 """Switch platform for CamPass."""
 import logging
+from collections.abc import Mapping
+from types import MappingProxyType
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
@@ -24,6 +26,9 @@ async def async_setup_entry(
 class CamPassSwitch(SwitchEntity, RestoreEntity):
     """Representation of a CamPass share switch."""
 
+    _ICON_ON = "mdi:camera-lock-open"
+    _ICON_OFF = "mdi:camera-lock"
+
     def __init__(self, entry: ConfigEntry) -> None:
         """Initialize the switch."""
         self._entry = entry
@@ -31,6 +36,8 @@ class CamPassSwitch(SwitchEntity, RestoreEntity):
         self._attr_name = f"CamPass: {entry.data['name']}"
         self.entity_id = f"switch.campass_{entry.data['slug']}"
         self._is_on = False
+        self._attrs_source = None
+        self._cached_attrs: Mapping = MappingProxyType({})
 
     async def async_added_to_hass(self) -> None:
         """Restore last known state on startup."""
@@ -46,7 +53,7 @@ class CamPassSwitch(SwitchEntity, RestoreEntity):
     @property
     def icon(self) -> str:
         """Return the icon."""
-        return "mdi:camera-lock-open" if self._is_on else "mdi:camera-lock"
+        return self._ICON_ON if self._is_on else self._ICON_OFF
 
     async def async_turn_on(self, **kwargs) -> None:
         """Turn the switch on."""
@@ -59,10 +66,16 @@ class CamPassSwitch(SwitchEntity, RestoreEntity):
         self.async_write_ha_state()
 
     @property
-    def extra_state_attributes(self) -> dict:
+    def extra_state_attributes(self) -> Mapping:
         """Return extra state attributes."""
-        return {
-            "slug": self._entry.data["slug"],
-            "cameras": self._entry.data["cameras"],
-            "url": f"/campass/{self._entry.data['slug']}/",
-        }
+        data = self._entry.data
+        # Entry data is replaced (not mutated) on update, so identity tells us when to rebuild
+        if data is not self._attrs_source:
+            slug = data["slug"]
+            self._cached_attrs = MappingProxyType({
+                "slug": slug,
+                "cameras": tuple(data["cameras"]),
+                "url": f"/campass/{slug}/",
+            })
+            self._attrs_source = data
+        return self._cached_attrs
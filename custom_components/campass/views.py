@@ -1,7 +1,12 @@
 """HTTP views for CamPass."""
 import asyncio
+import base64
+import hashlib
+import hmac
 import logging
-from datetime import datetime, timedelta, timezone
+import re
+import time
+from datetime import timedelta
 from pathlib import Path
 
 import jwt
@@ -9,94 +14,244 @@ from aiohttp import web
 from homeassistant.components.camera import async_get_image
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_state_change_event
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 from homeassistant.util.dt import utcnow
 
+try:
+    from homeassistant.helpers.http import KEY_HASS
+except ImportError:  # Home Assistant < 2024.2 only has the string key
+    KEY_HASS = "hass"
+
 from .const import CONF_ENABLE_NOTIFICATIONS, CONF_SESSION_DURATION, DOMAIN, SESSION_DURATIONS
 
 MAX_FAILED_ATTEMPTS = 10
 LOCKOUT_SECONDS = 5 * 60  # 5 minutes
+MAX_WRITE_BUFFER = 64 * 1024  # drop streaming clients that fall this far behind
+STREAM_WRITE_TIMEOUT = 10  # seconds a streaming write may block before the client is dropped
+SNAPSHOT_INTERVAL = 0.5  # seconds between fallback MJPEG frames
 
 _LOGGER = logging.getLogger(__name__)
 
 FRONTEND_DIR = Path(__file__).parent / "frontend"
 
+# Templates are read once at import; {{KEY}} placeholders are filled per request
+_PIN_TEMPLATE = (FRONTEND_DIR / "pin.html").read_text()
+_VIEWER_TEMPLATE = (FRONTEND_DIR / "viewer.html").read_text()
+_TEMPLATE_RE = re.compile(r"\{\{(\w+)\}\}")
 
-def get_entry_by_slug(hass: HomeAssistant, slug: str):
-    """Find a config entry by its slug."""
-    for entry in hass.config_entries.async_entries(DOMAIN):
-        if entry.data.get("slug") == slug:
-            return entry
-    return None
+# The events stream only ever sends one of these frames
+_SSE_ON = b'data: {"available": true}\n\n'
+_SSE_OFF = b'data: {"available": false}\n\n'
+_SSE_KEEPALIVE = b": keepalive\n\n"
 
+_MJPEG_HEADER = b"--frame\r\nContent-Type: image/jpeg\r\n\r\n"
+_MJPEG_TAIL = b"\r\n"
 
-def get_switch_entity_id(entry) -> str:
-    """Get the switch entity ID for a config entry."""
-    return f"switch.campass_{entry.data['slug']}"
+JWT_CACHE_SIZE = 1024
+JWT_CACHE_TTL = 30  # seconds
 
+# Verified tokens: sha256(secret + token) prefix -> (slug, monotonic expiry)
+_jwt_cache: dict[bytes, tuple[str, float]] = {}
 
-def is_sharing_enabled(hass: HomeAssistant, entry) -> bool:
-    """Check if sharing is enabled for a config entry."""
-    state = hass.states.get(get_switch_entity_id(entry))
+
+def get_entry_by_slug(hass: HomeAssistant, slug: str):
+    """Find a loaded config entry by its slug."""
+    return hass.data.get(DOMAIN, {}).get("_by_slug", {}).get(slug)
+
+
+def is_sharing_enabled(hass: HomeAssistant, entry_data: dict) -> bool:
+    """Check if sharing is enabled for a config entry's runtime data."""
+    state = hass.states.get(entry_data["switch_entity_id"])
     return state is not None and state.state == "on"
 
 
-def create_jwt_token(slug: str, secret: str, duration_seconds: int | None = 86400) -> str:
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+_JWT_HEADER_B64 = _b64url(b'{"alg":"HS256","typ":"JWT"}')
+
+
+def create_jwt_token(slug: str, secret: bytes, duration_seconds: int | None = 86400) -> str:
     """Create a JWT token. None duration = no expiration."""
     payload = {"slug": slug}
     if duration_seconds is not None:
-        payload["exp"] = datetime.now(timezone.utc) + timedelta(seconds=duration_seconds)
-    return jwt.encode(payload, secret, algorithm="HS256")
+        payload["exp"] = int(time.time()) + duration_seconds
+    # HS256 signed by hand: the header never changes and the payload is tiny,
+    # so PyJWT's algorithm lookup and stdlib JSON encoding are pure overhead
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(json_bytes(payload))
+    signature = hmac.new(secret, signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url(signature)).decode("ascii")
+
+
+def verify_jwt_token(token: str, slug: str, secret: bytes) -> bool:
+    """Verify a JWT token, reusing recent successful verifications."""
+    # Key on a hash so plaintext tokens aren't held; include the secret so a
+    # regenerated secret never matches an old entry
+    key = hashlib.sha256(secret + b"." + token.encode()).digest()[:16]
+    now = time.monotonic()
+    cached = _jwt_cache.get(key)
+    if cached is not None:
+        if cached[1] > now:
+            return cached[0] == slug
+        del _jwt_cache[key]
 
-
-def verify_jwt_token(token: str, slug: str, secret: str) -> bool:
-    """Verify a JWT token."""
     try:
         payload = jwt.decode(token, secret, algorithms=["HS256"])
-        return payload.get("slug") == slug
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError):
         return False
 
+    token_slug = payload.get("slug")
+    expires = now + JWT_CACHE_TTL
+    if "exp" in payload:
+        expires = min(expires, now + payload["exp"] - time.time())
+    if len(_jwt_cache) >= JWT_CACHE_SIZE:
+        # Evict the oldest entry (dicts keep insertion order)
+        del _jwt_cache[next(iter(_jwt_cache))]
+    _jwt_cache[key] = (token_slug, expires)
+    return token_slug == slug
+
+
+def _json_response(data, status: int = 200) -> web.Response:
+    """Return a JSON response serialized with HA's orjson-backed encoder."""
+    return web.Response(body=json_bytes(data), status=status, content_type="application/json")
 
-def _get_entry_and_verify(hass, slug, cookie_prefix="campass"):
-    """Get config entry and verify JWT. Returns (entry, error_response) tuple."""
+
+def _get_entry_and_verify(hass, slug):
+    """Get config entry and its runtime data. Returns (entry, entry_data, error_response) tuple."""
     entry = get_entry_by_slug(hass, slug)
     if not entry:
-        return None, web.json_response({"error": "Share not found"}, status=404)
+        return None, None, _json_response({"error": "Share not found"}, status=404)
 
     entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
-    if not entry_data or "jwt_secret" not in entry_data:
-        return None, web.json_response({"error": "Not configured"}, status=500)
+    if not entry_data or "jwt_secret_bytes" not in entry_data:
+        return None, None, _json_response({"error": "Not configured"}, status=500)
 
-    return entry, None
+    return entry, entry_data, None
 
 
-def _verify_cookie(request, slug, entry, hass):
+def _verify_cookie(request, slug, entry_data):
     """Verify the JWT cookie for a request. Returns True if valid."""
-    token = request.cookies.get(f"campass_{slug}")
+    token = request.cookies.get(entry_data["cookie_name"])
     if not token:
         return False
-    secret = hass.data[DOMAIN][entry.entry_id]["jwt_secret"]
-    return verify_jwt_token(token, slug, secret)
+    return verify_jwt_token(token, slug, entry_data["jwt_secret_bytes"])
 
 
-def _get_camera_entity(hass, camera_id):
-    """Get camera entity object from HA's camera component."""
+def _get_camera_entity(hass, entry_data, camera_id):
+    """Get camera entity object from HA's camera component, cached per share."""
+    camera_entities = entry_data.setdefault("camera_entities", {})
+    camera = camera_entities.get(camera_id)
+    if camera is not None:
+        return camera
     try:
         component = hass.data.get("camera")
         if component and hasattr(component, "get_entity"):
-            return component.get_entity(camera_id)
+            camera = component.get_entity(camera_id)
     except (KeyError, AttributeError):
         pass
-    return None
+    if camera is not None:
+        camera_entities[camera_id] = camera
+    return camera
+
+
+def _client_backed_up(transport) -> bool:
+    """Return True if a streaming client is gone or not keeping up with writes."""
+    return transport is None or transport.get_write_buffer_size() > MAX_WRITE_BUFFER
+
 
+async def _async_write_or_drop(response, transport, data: bytes) -> bool:
+    """Write to a streaming client. Returns False if the client was dropped.
 
-def _serve_html(filename: str, replacements: dict) -> web.Response:
-    """Serve an HTML file with template replacements."""
-    html = (FRONTEND_DIR / filename).read_text()
-    for key, value in replacements.items():
-        html = html.replace(f"{{{{{key}}}}}", value)
-    return web.Response(text=html, content_type="text/html")
+    aiohttp already waits for drain once enough data is queued, so a stalled
+    client blocks inside the write; the timeout catches that. A dropped client's
+    transport is aborted, otherwise write_eof() would wait on the same drain.
+    """
+    if not _client_backed_up(transport):
+        try:
+            await asyncio.wait_for(response.write(data), timeout=STREAM_WRITE_TIMEOUT)
+        except asyncio.TimeoutError:
+            pass
+        else:
+            return True
+    if transport is not None:
+        transport.abort()
+    return False
+
+
+def _serve_html(template: str, replacements: dict) -> web.Response:
+    """Serve an HTML template with {{KEY}} replacements."""
+    html = _TEMPLATE_RE.sub(
+        lambda m: replacements.get(m.group(1), m.group(0)), template
+    )
+    return web.Response(
+        body=html.encode("utf-8"), content_type="text/html", charset="utf-8"
+    )
+
+
+class _SnapshotPoller:
+    """Fetch snapshots for one camera and share each frame with every fallback MJPEG client."""
+
+    def __init__(self, hass: HomeAssistant, camera_id: str) -> None:
+        """Initialize the poller."""
+        self.camera_id = camera_id
+        self.latest: bytes | None = None  # most recent multipart-framed JPEG
+        self.failed = False
+        # Replaced on every frame; clients wait on the instance they grabbed
+        self.frame_event = asyncio.Event()
+        self.refs = 0
+        self._task = hass.async_create_background_task(
+            self._async_run(hass), f"campass snapshot poller {camera_id}"
+        )
+
+    async def _async_run(self, hass: HomeAssistant) -> None:
+        """Poll the camera until cancelled or a snapshot fails."""
+        try:
+            while True:
+                try:
+                    image = await async_get_image(hass, self.camera_id)
+                except Exception as err:
+                    _LOGGER.error("Snapshot error for %s: %s", self.camera_id, err)
+                    self.failed = True
+                    break
+                # Frame once here so every client writes the same bytes object
+                self.latest = b"".join((_MJPEG_HEADER, image.content, _MJPEG_TAIL))
+                self._notify()
+                await asyncio.sleep(SNAPSHOT_INTERVAL)
+        finally:
+            self._notify()
+
+    def _notify(self) -> None:
+        """Wake every client waiting for the next frame."""
+        event, self.frame_event = self.frame_event, asyncio.Event()
+        event.set()
+
+    def cancel(self) -> None:
+        """Stop polling."""
+        self._task.cancel()
+
+
+def _acquire_snapshot_poller(hass: HomeAssistant, camera_id: str) -> _SnapshotPoller:
+    """Return the shared poller for a camera, starting it if needed."""
+    pollers = hass.data[DOMAIN].setdefault("_pollers", {})
+    poller = pollers.get(camera_id)
+    if poller is None or poller.failed:
+        poller = pollers[camera_id] = _SnapshotPoller(hass, camera_id)
+    poller.refs += 1
+    return poller
+
+
+def _release_snapshot_poller(hass: HomeAssistant, poller: _SnapshotPoller) -> None:
+    """Drop a client's reference and stop the poller once nobody is watching."""
+    poller.refs -= 1
+    if poller.refs > 0:
+        return
+    poller.cancel()
+    pollers = hass.data[DOMAIN].get("_pollers", {})
+    if pollers.get(poller.camera_id) is poller:
+        del pollers[poller.camera_id]
 
 
 class CamPassRedirectView(HomeAssistantView):
@@ -120,11 +275,11 @@ class CamPassPinView(HomeAssistantView):
 
     async def get(self, request, slug):
         """Serve the PIN entry page."""
-        entry = get_entry_by_slug(request.app["hass"], slug)
+        entry = get_entry_by_slug(request.app[KEY_HASS], slug)
         if not entry:
             return web.Response(text="Share not found", status=404)
 
-        return _serve_html("pin.html", {
+        return _serve_html(_PIN_TEMPLATE, {
             "SHARE_NAME": entry.data["name"],
             "SLUG": slug,
             "AUTH_TYPE": entry.data.get("auth_type", "pin4"),
@@ -140,16 +295,16 @@ class CamPassViewerView(HomeAssistantView):
 
     async def get(self, request, slug):
         """Serve the viewer page."""
-        hass = request.app["hass"]
-        entry = get_entry_by_slug(hass, slug)
-        if not entry:
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
+        if err:
             return web.Response(text="Share not found", status=404)
 
-        if not _verify_cookie(request, slug, entry, hass):
+        if not _verify_cookie(request, slug, entry_data):
             # Redirect to PIN page instead of showing raw 401
             raise web.HTTPFound(f"/campass/{slug}/")
 
-        return _serve_html("viewer.html", {
+        return _serve_html(_VIEWER_TEMPLATE, {
             "SHARE_NAME": entry.data["name"],
             "SLUG": slug,
         })
@@ -164,8 +319,8 @@ class CamPassAuthView(HomeAssistantView):
 
     async def post(self, request, slug):
         """Authenticate with PIN."""
-        hass = request.app["hass"]
-        entry, err = _get_entry_and_verify(hass, slug)
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
         if err:
             return err
 
@@ -185,29 +340,29 @@ class CamPassAuthView(HomeAssistantView):
         # Check lockout
         if attempt_info["locked_until"] is not None:
             if utcnow() < attempt_info["locked_until"]:
-                return web.json_response({"error": "Too many failed attempts. Try again later."}, status=429)
+                return _json_response({"error": "Too many failed attempts. Try again later."}, status=429)
             else:
                 # Lockout expired — reset
                 attempt_info = {"count": 0, "locked_until": None}
                 failed_attempts[attempt_key] = attempt_info
 
         try:
-            data = await request.json()
+            data = json_loads(await request.read())
             pin = data.get("pin", "")
         except Exception:
-            return web.json_response({"error": "Invalid request"}, status=400)
+            return _json_response({"error": "Invalid request"}, status=400)
 
-        stored_passcode = entry.data.get("passcode", entry.data.get("pin", ""))
+        passcode_bytes = entry_data["passcode_bytes"]
+        match = hmac.compare_digest(str(pin).encode("utf-8"), passcode_bytes)
         _LOGGER.debug(
-            "CamPass auth for %s: input=%r (type=%s), stored=%r (type=%s), match=%s",
-            slug, pin, type(pin).__name__, stored_passcode, type(stored_passcode).__name__,
-            pin == stored_passcode,
+            "CamPass auth for %s: input type=%s, match=%s",
+            slug, type(pin).__name__, match,
         )
-        if str(pin) == str(stored_passcode):
+        if match:
             # Reset failed attempts on success
             failed_attempts.pop(attempt_key, None)
 
-            secret = hass.data[DOMAIN][entry.entry_id]["jwt_secret"]
+            secret = entry_data["jwt_secret_bytes"]
             duration_key = entry.data.get(CONF_SESSION_DURATION, "24h")
             _, duration_seconds = SESSION_DURATIONS.get(duration_key, ("24 hours", 86400))
             token = create_jwt_token(slug, secret, duration_seconds=duration_seconds)
@@ -233,11 +388,11 @@ class CamPassAuthView(HomeAssistantView):
                     },
                 )
 
-            response = web.json_response({"success": True})
+            response = _json_response({"success": True})
             # Cookie max_age matches JWT duration, or 10 years for never-expires
             max_age = duration_seconds if duration_seconds is not None else 315360000
             response.set_cookie(
-                f"campass_{slug}",
+                entry_data["cookie_name"],
                 token,
                 max_age=max_age,
                 httponly=True,
@@ -267,7 +422,7 @@ class CamPassAuthView(HomeAssistantView):
             "timestamp": utcnow().isoformat(),
         })
 
-        return web.json_response({"error": "Invalid PIN"}, status=401)
+        return _json_response({"error": "Invalid PIN"}, status=401)
 
 
 class CamPassStatusView(HomeAssistantView):
@@ -279,28 +434,17 @@ class CamPassStatusView(HomeAssistantView):
 
     async def get(self, request, slug):
         """Get share status."""
-        hass = request.app["hass"]
-        entry, err = _get_entry_and_verify(hass, slug)
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
         if err:
             return err
 
-        if not _verify_cookie(request, slug, entry, hass):
-            return web.json_response({"error": "Unauthorized"}, status=401)
-
-        available = is_sharing_enabled(hass, entry)
+        if not _verify_cookie(request, slug, entry_data):
+            return _json_response({"error": "Unauthorized"}, status=401)
 
-        cameras = []
-        for camera_id in entry.data.get("cameras", []):
-            state = hass.states.get(camera_id)
-            if state:
-                cameras.append({
-                    "entity_id": camera_id,
-                    "name": state.attributes.get("friendly_name", camera_id),
-                })
-
-        return web.json_response({
-            "available": available,
-            "cameras": cameras,
+        return _json_response({
+            "available": is_sharing_enabled(hass, entry_data),
+            "cameras": entry_data["cameras_payload"],
         })
 
 
@@ -313,12 +457,12 @@ class CamPassEventsView(HomeAssistantView):
 
     async def get(self, request, slug):
         """Stream status events."""
-        hass = request.app["hass"]
-        entry, err = _get_entry_and_verify(hass, slug)
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
         if err:
             return err
 
-        if not _verify_cookie(request, slug, entry, hass):
+        if not _verify_cookie(request, slug, entry_data):
             return web.Response(text="Unauthorized", status=401)
 
         response = web.StreamResponse()
@@ -327,38 +471,38 @@ class CamPassEventsView(HomeAssistantView):
         response.headers["Connection"] = "keep-alive"
         response.headers["X-Accel-Buffering"] = "no"
         await response.prepare(request)
+        transport = request.transport
 
-        available = is_sharing_enabled(hass, entry)
-        await response.write(
-            f"data: {{\"available\": {str(available).lower()}}}\n\n".encode()
-        )
-
-        switch_id = get_switch_entity_id(entry)
+        # One shared listener per share wakes every subscribed client
+        hub = entry_data["sse_hub"]
         change_event = asyncio.Event()
-        state_data = {"available": available}
-
-        def on_state_change(ev):
-            new_state = ev.data.get("new_state")
-            if new_state:
-                state_data["available"] = new_state.state == "on"
-                change_event.set()
-
-        unsub = async_track_state_change_event(hass, [switch_id], on_state_change)
+        hub["subs"].add(change_event)
 
         try:
+            available = is_sharing_enabled(hass, entry_data)
+            if not await _async_write_or_drop(
+                response, transport, _SSE_ON if available else _SSE_OFF
+            ):
+                _LOGGER.debug("Dropping slow events client for %s", slug)
+                return response
+
             while True:
                 try:
                     await asyncio.wait_for(change_event.wait(), timeout=15.0)
                     change_event.clear()
-                    await response.write(
-                        f"data: {{\"available\": {str(state_data['available']).lower()}}}\n\n".encode()
-                    )
+                    if hub["closed"]:
+                        # Share was unloaded; the client's onerror reconnects to the new hub
+                        break
+                    payload = _SSE_ON if hub["available"] else _SSE_OFF
                 except asyncio.TimeoutError:
-                    await response.write(b": keepalive\n\n")
+                    payload = _SSE_KEEPALIVE
+                if not await _async_write_or_drop(response, transport, payload):
+                    _LOGGER.debug("Dropping slow events client for %s", slug)
+                    break
         except (asyncio.CancelledError, ConnectionResetError, ConnectionError):
             pass
         finally:
-            unsub()
+            hub["subs"].discard(change_event)
 
         return response
 
@@ -372,19 +516,20 @@ class CamPassStreamInfoView(HomeAssistantView):
 
     async def get(self, request, slug, camera_id):
         """Get stream URL for camera."""
-        hass = request.app["hass"]
-        entry, err = _get_entry_and_verify(hass, slug)
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
         if err:
             return err
 
-        if not _verify_cookie(request, slug, entry, hass):
-            return web.json_response({"error": "Unauthorized"}, status=401)
+        # Cheap checks first so disabled shares never pay for JWT verification
+        if camera_id not in entry_data["cameras_set"]:
+            return _json_response({"error": "Camera not allowed"}, status=403)
 
-        if not is_sharing_enabled(hass, entry):
-            return web.json_response({"error": "Sharing is disabled"}, status=403)
+        if not is_sharing_enabled(hass, entry_data):
+            return _json_response({"error": "Sharing is disabled"}, status=403)
 
-        if camera_id not in entry.data.get("cameras", []):
-            return web.json_response({"error": "Camera not allowed"}, status=403)
+        if not _verify_cookie(request, slug, entry_data):
+            return _json_response({"error": "Unauthorized"}, status=401)
 
         # Fire camera_view event
         hass.bus.async_fire("campass_access", {
@@ -398,19 +543,19 @@ class CamPassStreamInfoView(HomeAssistantView):
 
         # Try HLS via HA's stream component
         try:
-            camera = _get_camera_entity(hass, camera_id)
+            camera = _get_camera_entity(hass, entry_data, camera_id)
             if camera:
                 stream = await camera.async_create_stream()
                 if stream:
                     stream.add_provider("hls")
                     await stream.start()
                     url = stream.endpoint_url("hls")
-                    return web.json_response({"type": "hls", "url": url})
+                    return _json_response({"type": "hls", "url": url})
         except Exception as err:
             _LOGGER.debug("HLS stream unavailable for %s: %s", camera_id, err)
 
         # Fallback to MJPEG
-        return web.json_response({
+        return _json_response({
             "type": "mjpeg",
             "url": f"/campass/{slug}/api/stream/{camera_id}",
         })
@@ -425,50 +570,55 @@ class CamPassStreamView(HomeAssistantView):
 
     async def get(self, request, slug, camera_id):
         """Proxy camera stream."""
-        hass = request.app["hass"]
-        entry, err = _get_entry_and_verify(hass, slug)
+        hass = request.app[KEY_HASS]
+        entry, entry_data, err = _get_entry_and_verify(hass, slug)
         if err:
             return web.Response(text="Share not found", status=404)
 
-        if not _verify_cookie(request, slug, entry, hass):
-            return web.Response(text="Unauthorized", status=401)
+        # Cheap checks first so disabled shares never pay for JWT verification
+        if camera_id not in entry_data["cameras_set"]:
+            return web.Response(text="Camera not allowed", status=403)
 
-        if not is_sharing_enabled(hass, entry):
+        if not is_sharing_enabled(hass, entry_data):
             return web.Response(text="Sharing is disabled", status=403)
 
-        if camera_id not in entry.data.get("cameras", []):
-            return web.Response(text="Camera not allowed", status=403)
+        if not _verify_cookie(request, slug, entry_data):
+            return web.Response(text="Unauthorized", status=401)
 
         # Try native MJPEG
-        camera = _get_camera_entity(hass, camera_id)
+        camera = _get_camera_entity(hass, entry_data, camera_id)
         if camera and hasattr(camera, "handle_async_mjpeg_stream"):
             try:
                 return await camera.handle_async_mjpeg_stream(request)
             except Exception as err:
                 _LOGGER.warning("Native MJPEG failed for %s: %s", camera_id, err)
 
-        # Fallback: snapshot polling
+        # Fallback: snapshot polling, shared by all clients of this camera
         response = web.StreamResponse()
         response.content_type = "multipart/x-mixed-replace; boundary=frame"
         await response.prepare(request)
+        transport = request.transport
+        poller = _acquire_snapshot_poller(hass, camera_id)
 
         try:
+            if poller.latest is None:
+                await poller.frame_event.wait()
             while True:
-                try:
-                    image = await async_get_image(hass, camera_id)
-                    await response.write(
-                        b"--frame\r\n"
-                        b"Content-Type: image/jpeg\r\n\r\n"
-                        + image.content
-                        + b"\r\n"
-                    )
-                except Exception as err:
-                    _LOGGER.error("Snapshot error for %s: %s", camera_id, err)
+                if poller.failed or poller.latest is None:
+                    break
+                # Grab the event before writing so a frame published mid-write isn't missed
+                frame_event = poller.frame_event
+                if not await _async_write_or_drop(response, transport, poller.latest):
+                    _LOGGER.debug("Dropping slow stream client for %s", camera_id)
                     break
-                await asyncio.sleep(0.5)
+                await frame_event.wait()
         except (asyncio.CancelledError, ConnectionResetError, ConnectionError):
             pass
         finally:
-            await response.write_eof()
+            _release_snapshot_poller(hass, poller)
+            try:
+                await response.write_eof()
+            except (ConnectionResetError, ConnectionError):
+                pass  # client went away or was dropped
 
         return response